@@ -1,22 +1,34 @@
 from __future__ import annotations
 
 import os
+import re
 import shutil
+import sys
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 
+# Snapshot the environment once; every config default below reads from it.
+_ENV: dict[str, str] = dict(os.environ)
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_ADDRESS_REGEX = r"0[xX][a-fA-F0-9]{40}"
+_ADDRESS_PATTERN = re.compile(_ADDRESS_REGEX)
+
 
 def _env_bool(name: str, default: bool) -> bool:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if value is None:
         return default
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
 def _env_int(name: str, default: int) -> int:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if value is None:
         return default
     try:
@@ -26,7 +38,7 @@ def _env_int(name: str, default: int) -> int:
 
 
 def _env_float(name: str, default: float) -> float:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if value is None:
         return default
     try:
@@ -36,7 +48,7 @@ def _env_float(name: str, default: float) -> float:
 
 
 def _env_point(name: str, default: tuple[int, int]) -> tuple[int, int]:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if not value:
         return default
     parts = [part.strip() for part in value.split(",")]
@@ -49,7 +61,7 @@ def _env_point(name: str, default: tuple[int, int]) -> tuple[int, int]:
 
 
 def _env_float_pair(name: str, default: tuple[float, float]) -> tuple[float, float]:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if not value:
         return default
     parts = [part.strip() for part in value.split(",") if part.strip()]
@@ -64,9 +76,9 @@ def _env_float_pair(name: str, default: tuple[float, float]) -> tuple[float, flo
 def _env_selectors(name: str, default: str, legacy: str | None = None) -> tuple[str, ...]:
     source = None
     if legacy:
-        source = os.getenv(legacy)
+        source = _ENV.get(legacy)
     if source is None:
-        source = os.getenv(name)
+        source = _ENV.get(name)
     if source is None:
         source = default
     selectors = [item.strip() for item in source.split(",") if item.strip()]
@@ -74,7 +86,7 @@ def _env_selectors(name: str, default: str, legacy: str | None = None) -> tuple[
 
 
 def _resolve_tesseract_cmd() -> str | None:
-    env_path = os.getenv("TESSERACT_CMD")
+    env_path = _ENV.get("TESSERACT_CMD")
     if env_path:
         return env_path
 
@@ -82,7 +94,7 @@ def _resolve_tesseract_cmd() -> str | None:
         r"C:\Program Files\Tesseract-OCR\tesseract.exe",
         r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
         r"C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe".format(
-            os.getenv("USERNAME", "")
+            _ENV.get("USERNAME", "")
         ),
     ]
     for guess in guesses:
@@ -99,15 +111,15 @@ def _resolve_tesseract_cmd() -> str | None:
 
 @dataclass(frozen=True)
 class OCRConfig:
-    window_title_pattern: str = os.getenv(
+    window_title_pattern: str = _ENV.get(
         "WECHAT_WINDOW_TITLE_PATTERN",
         r"(锁子密码【禁言群】🚫)|微信",
     )
-    window_class_name: str = os.getenv(
+    window_class_name: str = _ENV.get(
         "WECHAT_WINDOW_CLASS_NAME",
         "WeChatMainWndForPC",
     )
-    pywinauto_backend: str = os.getenv("WECHAT_PYWINBACKEND", "uia")
+    pywinauto_backend: str = _ENV.get("WECHAT_PYWINBACKEND", "uia")
     poll_interval_seconds: float = max(1.5, _env_float("OCR_POLL_INTERVAL", 1.5))
     normalize_letter_o: bool = _env_bool("OCR_NORMALIZE_O", True)
     chat_left_ratio: float = _env_float("WECHAT_CHAT_LEFT_RATIO", 0.4)
@@ -117,34 +129,59 @@ class OCRConfig:
     min_capture_width: int = _env_int("WECHAT_MIN_CAPTURE_WIDTH", 120)
     min_capture_height: int = _env_int("WECHAT_MIN_CAPTURE_HEIGHT", 120)
     force_focus: bool = _env_bool("WECHAT_FORCE_FOCUS", True)
-    address_regex: str = r"0[xX][a-fA-F0-9]{40}"
-    tesseract_cmd: str | None = _resolve_tesseract_cmd()
-    tesseract_lang: str = os.getenv("TESSERACT_LANG", "eng")
+    # address_regex is kept for compatibility; prefer the compiled address_pattern.
+    address_regex: str = _ADDRESS_REGEX
+    address_pattern: re.Pattern[str] = _ADDRESS_PATTERN
+    tesseract_lang: str = _ENV.get("TESSERACT_LANG", "eng")
+    tesseract_config: str = _ENV.get("TESSERACT_CONFIG", "")
+    # Optional bounding box for captures: frames wider or taller than these are
+    # shrunk once, with INTER_AREA, before preprocessing. 0 disables a limit.
+    # Both are off by default because small chat fonts lose OCR accuracy.
+    max_ocr_width: int = _env_int("OCR_MAX_WIDTH", 0)
+    target_height: int = _env_int("OCR_TARGET_HEIGHT", 0)
+    # Stack up to this many changed frames into one tesseract call; 1 disables
+    # batching, which otherwise delays a new frame by up to (N - 1) intervals.
+    batch_frames: int = max(1, _env_int("OCR_BATCH_FRAMES", 1))
     use_adaptive_threshold: bool = _env_bool(
         "OCR_USE_ADAPTIVE_THRESHOLD",
         True,
     )
+    # "mean" thresholds against a box-filtered local mean with no separate blur
+    # pass; "gaussian" keeps the GaussianBlur + Gaussian-weighted threshold.
+    threshold_method: str = _ENV.get("OCR_THRESHOLD_METHOD", "mean").strip().lower()
     threshold_block_size: int = _env_int("OCR_THRESHOLD_BLOCK_SIZE", 31)
     threshold_constant: int = _env_int("OCR_THRESHOLD_CONSTANT", 6)
     gaussian_kernel_size: int = _env_int("OCR_GAUSSIAN_KERNEL_SIZE", 3)
+    # OpenCV worker threads for preprocessing: 0 picks cpu_count() - 1,
+    # a negative value leaves OpenCV's own default untouched.
+    cv_threads: int = _env_int("OCR_CV_THREADS", 0)
+    # Run blur/threshold through OpenCV's OpenCL T-API (cv2.UMat) on frames of at
+    # least opencl_min_pixels; smaller frames lose more to the upload than they gain.
+    use_opencl: bool = _env_bool("OCR_USE_OPENCL", False)
+    opencl_min_pixels: int = _env_int("OCR_OPENCL_MIN_PIXELS", 1_000_000)
 
+    @cached_property
+    def tesseract_cmd(self) -> str | None:
+        # Probing install paths touches the filesystem; defer until OCR needs it.
+        return _resolve_tesseract_cmd()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class StorageConfig:
     addresses_file: Path = Path(
-        os.getenv("ADDRESSES_FILE", DATA_DIR / "addresses.txt")
+        _ENV.get("ADDRESSES_FILE", DATA_DIR / "addresses.txt")
     )
     backup_dir: Path = Path(
-        os.getenv("ADDRESSES_BACKUP_DIR", DATA_DIR / "backup")
+        _ENV.get("ADDRESSES_BACKUP_DIR", DATA_DIR / "backup")
     )
     temp_scan_file: Path = Path(
-        os.getenv("TEMP_SCAN_FILE", DATA_DIR / "temp_addresses.txt")
+        _ENV.get("TEMP_SCAN_FILE", DATA_DIR / "temp_addresses.txt")
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class TradeConfig:
-    binance_trading_url: str = os.getenv(
+    binance_trading_url: str = _ENV.get(
         "BINANCE_TRADING_URL",
         "https://web3.binance.com/zh-CN/markets/trending?chain=bsc",
     )
@@ -176,12 +213,12 @@ class TradeConfig:
         "BINANCE_TRENDING_TRADE_BUTTON_SELECTORS",
         "button:has-text('交易'),a:has-text('交易'),button:has-text('Swap'),a:has-text('Swap')",
     )
-    swap_url_template: str = os.getenv(
+    swap_url_template: str = _ENV.get(
         "BINANCE_SWAP_URL_TEMPLATE",
         "",
     )
-    automation_mode: str = os.getenv("TRADE_AUTOMATION_MODE", "gui").lower()
-    chrome_window_title_pattern: str = os.getenv(
+    automation_mode: str = _ENV.get("TRADE_AUTOMATION_MODE", "gui").lower()
+    chrome_window_title_pattern: str = _ENV.get(
         "CHROME_WINDOW_TITLE_PATTERN",
         r"(BSC 市场上的热门代币和 Meme 币 \| 币安钱包 - Google Chrome)|Binance|Google Chrome",
     )
@@ -243,37 +280,44 @@ class TradeConfig:
         (377, 443),
     )
     chrome_price_offset: float = _env_float("CHROME_PRICE_OFFSET", 0.006)
+    price_api_url_template: str = _ENV.get("BINANCE_PRICE_API_URL_TEMPLATE", "")
+    price_api_json_path: str = _ENV.get("BINANCE_PRICE_API_JSON_PATH", "data.price")
+    price_api_timeout_seconds: float = _env_float("BINANCE_PRICE_API_TIMEOUT", 2.0)
     chrome_page_load_seconds: float = _env_float("CHROME_PAGE_LOAD_SECONDS", 4.0)
     chrome_result_wait_seconds: float = _env_float("CHROME_RESULT_WAIT_SECONDS", 1.5)
     chrome_trade_wait_seconds: float = _env_float("CHROME_TRADE_WAIT_SECONDS", 2.5)
     play_alert_sound: bool = _env_bool("TRADE_PLAY_ALERT_SOUND", False)
-    browser_profile_path: str | None = os.getenv(
+    browser_profile_path: str | None = _ENV.get(
         "PLAYWRIGHT_USER_DATA_DIR"
     )
+    storage_state_path: Path = Path(
+        _ENV.get("PLAYWRIGHT_STORAGE_STATE", DATA_DIR / "storage_state.json")
+    )
     headless: bool = _env_bool("PLAYWRIGHT_HEADLESS", False)
-    browser_channel: str | None = os.getenv(
+    block_heavy_assets: bool = _env_bool("PLAYWRIGHT_BLOCK_HEAVY_ASSETS", False)
+    browser_channel: str | None = _ENV.get(
         "PLAYWRIGHT_BROWSER_CHANNEL",
         "chrome",
     ) or None
-    browser_executable_path: str | None = os.getenv(
+    browser_executable_path: str | None = _ENV.get(
         "PLAYWRIGHT_BROWSER_EXECUTABLE"
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class LoggingConfig:
-    level: str = os.getenv("LOG_LEVEL", "INFO")
-    log_file: Path = Path(os.getenv("LOG_FILE", DATA_DIR / "bot.log"))
+    level: str = _ENV.get("LOG_LEVEL", "INFO")
+    log_file: Path = Path(_ENV.get("LOG_FILE", DATA_DIR / "bot.log"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class PipelineConfig:
     debounce_seconds: float = _env_float("PIPELINE_DEBOUNCE_SECONDS", 1.5)
     retry_attempts: int = _env_int("PIPELINE_RETRY_ATTEMPTS", 3)
     retry_delay_seconds: float = _env_float("PIPELINE_RETRY_DELAY", 2.0)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class AppConfig:
     ocr: OCRConfig = OCRConfig()
     storage: StorageConfig = StorageConfig()
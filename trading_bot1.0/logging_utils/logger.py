@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -9,9 +11,11 @@ from config import CONFIG
 
 
 _LOGGER: Optional[logging.Logger] = None
+_LISTENER: Optional[QueueListener] = None
 
 
 def _configure_logger() -> logging.Logger:
+    global _LISTENER
     log_file: Path = CONFIG.logging.log_file
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -26,13 +30,23 @@ def _configure_logger() -> logging.Logger:
     if not logger.handlers:
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
 
         file_handler = RotatingFileHandler(
             log_file, maxBytes=1_000_000, backupCount=5, encoding="utf-8"
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        # Callers only enqueue records; a background thread does the I/O.
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _LISTENER = QueueListener(
+            log_queue,
+            stream_handler,
+            file_handler,
+            respect_handler_level=True,
+        )
+        _LISTENER.start()
+        atexit.register(_LISTENER.stop)
 
     return logger
 
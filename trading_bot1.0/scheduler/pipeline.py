@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from asyncio import QueueEmpty
+import time
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -16,6 +17,13 @@ from wechat_ocr_listener import WeChatOCRListener
 logger = get_logger(__name__)
 
 
+class LatestOnlyQueue(asyncio.Queue):
+    """asyncio.Queue that keeps only the most recently put item."""
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = deque(maxlen=1)
+
+
 class TradingPipeline:
     """Coordinates OCR listener events with the trading executor."""
 
@@ -23,7 +31,7 @@ class TradingPipeline:
         self._repo = AddressRepository()
         self._time_guard = TimeGuard()
         self._trader = BinanceTrader()
-        self._queue: asyncio.Queue[AddressRecord] = asyncio.Queue()
+        self._queue: LatestOnlyQueue[AddressRecord] = LatestOnlyQueue()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._listener = WeChatOCRListener(
             repository=self._repo,
@@ -32,7 +40,8 @@ class TradingPipeline:
         self._last_executed_address: Optional[str] = None
         self._last_execution_time: Optional[datetime] = None
         self._config = CONFIG.pipeline
-        self._recent_executions: dict[str, datetime] = {}
+        # Debounce bookkeeping uses time.monotonic() seconds, kept oldest-first.
+        self._recent_executions: OrderedDict[str, float] = OrderedDict()
 
     def _handle_new_record(self, record: AddressRecord) -> None:
         if not self._loop:
@@ -46,23 +55,19 @@ class TradingPipeline:
             self._listener.start()
         except Exception as exc:
             logger.error("Failed to start WeChat OCR listener: %s", exc)
-            await self._trader.close()
+            await self._trader.shutdown()
             return
         logger.info("Trading pipeline started")
         try:
             while True:
+                # Bursts of OCR hits coalesce to the newest record in the queue.
                 record = await self._queue.get()
-                while True:
-                    try:
-                        record = self._queue.get_nowait()
-                    except QueueEmpty:
-                        break
                 await self._process_record(record)
         except asyncio.CancelledError:
             logger.info("Trading pipeline cancelled")
         finally:
             self._listener.stop()
-            await self._trader.close()
+            await self._trader.shutdown()
 
     async def _process_record(self, record: AddressRecord) -> None:
         if not self._time_guard.is_recent(record):
@@ -83,31 +88,29 @@ class TradingPipeline:
             await self._execute_with_retry(record.address)
         finally:
             self._listener.resume()
-        now = datetime.now(timezone.utc)
+        now = time.monotonic()
         self._last_executed_address = record.address
-        self._last_execution_time = now
+        self._last_execution_time = datetime.now(timezone.utc)
+        self._recent_executions.pop(record.address, None)
         self._recent_executions[record.address] = now
         self._prune_recent_executions(now)
 
     def _should_skip(self, record: AddressRecord) -> bool:
         last_exec = self._recent_executions.get(record.address)
-        if not last_exec:
+        if last_exec is None:
             return False
-        elapsed = datetime.now(timezone.utc) - last_exec
-        return elapsed.total_seconds() < self._config.debounce_seconds
+        return time.monotonic() - last_exec < self._config.debounce_seconds
 
-    def _prune_recent_executions(self, reference: datetime | None = None) -> None:
+    def _prune_recent_executions(self, reference: float | None = None) -> None:
         if not self._recent_executions:
             return
-        now = reference or datetime.now(timezone.utc)
+        now = reference if reference is not None else time.monotonic()
         threshold = self._config.debounce_seconds
-        stale = [
-            address
-            for address, ts in self._recent_executions.items()
-            if (now - ts).total_seconds() >= threshold
-        ]
-        for address in stale:
-            self._recent_executions.pop(address, None)
+        while self._recent_executions:
+            oldest = next(iter(self._recent_executions.values()))
+            if now - oldest < threshold:
+                break
+            self._recent_executions.popitem(last=False)
 
     async def _execute_with_retry(self, address: str) -> None:
         attempts = self._config.retry_attempts
@@ -1,43 +1,86 @@
 from __future__ import annotations
 
+import os
+import shutil
 import threading
-from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, NamedTuple, Optional
 
 from config import CONFIG
 from logging_utils.logger import get_logger
 
+try:  # Optional faster ISO-8601 parser; datetime.fromisoformat is the fallback.
+    from ciso8601 import parse_datetime as _parse_timestamp
+except ImportError:  # pragma: no cover - depends on environment
+    _parse_timestamp = datetime.fromisoformat
+
 
 logger = get_logger(__name__)
 
 
-@dataclass(frozen=True)
-class AddressRecord:
+class AddressRecord(NamedTuple):
     timestamp: datetime
     address: str
 
     @classmethod
     def from_line(cls, line: str) -> Optional["AddressRecord"]:
-        parts = line.strip().split("|", maxsplit=1)
-        if len(parts) != 2:
-            return None
-        ts_part, address_part = parts
-        try:
-            timestamp = datetime.fromisoformat(ts_part)
-        except ValueError:
-            return None
-        return cls(timestamp=timestamp, address=address_part.strip())
+        return _parse_line_cached(line)
 
     def to_line(self) -> str:
         return f"{self.timestamp.isoformat()}|{self.address}"
 
 
+@lru_cache(maxsize=8192)
+def _parse_line_cached(line: str) -> Optional[AddressRecord]:
+    # Records are immutable tuples, so identical lines can safely share one instance.
+    parts = line.strip().split("|", maxsplit=1)
+    if len(parts) != 2:
+        return None
+    ts_part, address_part = parts
+    try:
+        timestamp = _parse_timestamp(ts_part)
+    except ValueError:
+        return None
+    return AddressRecord(timestamp=timestamp, address=address_part.strip())
+
+
+def _tail_line(path: Path, chunk_size: int = 4096) -> Optional[str]:
+    """Return the last non-empty line of ``path`` by reading backwards from EOF."""
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell()
+        buffer = b""
+        while position > 0:
+            step = min(chunk_size, position)
+            position -= step
+            handle.seek(position)
+            buffer = handle.read(step) + buffer
+            stripped = buffer.rstrip(b"\r\n")
+            newline = stripped.rfind(b"\n")
+            if newline != -1:
+                return stripped[newline + 1 :].decode("utf-8", errors="replace")
+    stripped = buffer.rstrip(b"\r\n")
+    return stripped.decode("utf-8", errors="replace") if stripped else None
+
+
 class AddressRepository:
-    def __init__(self, file_path: Path | None = None) -> None:
+    """Append-only address log with an in-memory index of the latest record per address."""
+
+    def __init__(
+        self,
+        file_path: Path | None = None,
+        *,
+        compact_threshold: int = 1000,
+    ) -> None:
         self._file_path = file_path or CONFIG.storage.addresses_file
         self._lock = threading.Lock()
+        self._compact_threshold = max(0, compact_threshold)
+        self._index: dict[str, AddressRecord] = {}
+        self._latest: Optional[AddressRecord] = None
+        self._line_count = 0
+        self._index_loaded = False
         self._ensure_file()
         logger.debug("Address repository initialized at %s", self._file_path)
 
@@ -46,29 +89,75 @@ class AddressRepository:
         if not self._file_path.exists():
             self._file_path.write_text("", encoding="utf-8")
 
+    def _ensure_index(self) -> None:
+        # Caller must hold self._lock. The full scan is deferred until a write
+        # or history read needs it; read_latest can be served from the tail.
+        if not self._index_loaded:
+            self._load_index()
+
+    def _load_index(self) -> None:
+        lines = self._file_path.read_text(encoding="utf-8").splitlines()
+        index: dict[str, AddressRecord] = {}
+        line_count = 0
+        for line in lines:
+            record = AddressRecord.from_line(line)
+            if not record:
+                continue
+            line_count += 1
+            current = index.get(record.address)
+            if not current or record.timestamp > current.timestamp:
+                index[record.address] = record
+        self._index = index
+        self._line_count = line_count
+        self._latest = max(index.values(), key=lambda r: r.timestamp, default=None)
+        self._index_loaded = True
+
+    def _sorted_records(self) -> List[AddressRecord]:
+        return sorted(self._index.values(), key=lambda r: r.timestamp)
+
+    def _compact(self) -> None:
+        # Caller must hold self._lock. Rewrites the log as one line per address.
+        serialized = "\n".join(item.to_line() for item in self._sorted_records())
+        if serialized:
+            serialized += "\n"
+        tmp_path = self._file_path.with_name(self._file_path.name + ".tmp")
+        try:
+            tmp_path.write_text(serialized, encoding="utf-8")
+            os.replace(tmp_path, self._file_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._line_count = len(self._index)
+        logger.debug("Compacted address log to %s entries", self._line_count)
+
     def append(self, record: AddressRecord) -> None:
         with self._lock:
-            lines = self._file_path.read_text(encoding="utf-8").splitlines()
-            records_by_address: dict[str, AddressRecord] = {}
-            for line in lines:
-                existing = AddressRecord.from_line(line)
-                if not existing:
-                    continue
-                current = records_by_address.get(existing.address)
-                if not current or existing.timestamp > current.timestamp:
-                    records_by_address[existing.address] = existing
-
-            previous = records_by_address.get(record.address)
-            records_by_address[record.address] = record
-
-            sorted_records = sorted(
-                records_by_address.values(),
-                key=lambda r: r.timestamp,
-            )
-            serialized = "\n".join(item.to_line() for item in sorted_records)
-            if serialized:
-                serialized += "\n"
-            self._file_path.write_text(serialized, encoding="utf-8")
+            self._ensure_index()
+            previous = self._index.get(record.address)
+            # Reject anything older than the newest record of any address, not
+            # just this one: keeping the log in timestamp order is what lets
+            # read_latest answer from the last line before the index loads.
+            if self._latest and record.timestamp < self._latest.timestamp:
+                logger.debug(
+                    "Ignoring stale record for %s (latest=%s new=%s)",
+                    record.address,
+                    self._latest.timestamp.isoformat(),
+                    record.timestamp.isoformat(),
+                )
+                return
+            with self._file_path.open("a", encoding="utf-8") as handle:
+                handle.write(record.to_line() + "\n")
+            self._line_count += 1
+            self._index[record.address] = record
+            self._latest = record
+            if self._line_count - len(self._index) > self._compact_threshold:
+                # The record is already on disk and indexed; a failed swap (e.g.
+                # another process holding the file on Windows) is retried on
+                # the next append or backup().
+                try:
+                    self._compact()
+                except OSError as exc:
+                    logger.warning("Failed to compact address log: %s", exc)
 
         if previous:
             logger.info(
@@ -82,22 +171,23 @@ class AddressRepository:
 
     def read_all(self) -> List[AddressRecord]:
         with self._lock:
-            lines = self._file_path.read_text(encoding="utf-8").splitlines()
-        records: List[AddressRecord] = []
-        for line in lines:
-            record = AddressRecord.from_line(line)
-            if record:
-                records.append(record)
-        return records
+            self._ensure_index()
+            return self._sorted_records()
 
     def read_latest(self) -> Optional[AddressRecord]:
         with self._lock:
-            lines = self._file_path.read_text(encoding="utf-8").splitlines()
-        for line in reversed(lines):
-            record = AddressRecord.from_line(line)
+            if self._index_loaded:
+                return self._latest
+            try:
+                line = _tail_line(self._file_path)
+            except OSError as exc:
+                logger.debug("Tail read of %s failed: %s", self._file_path, exc)
+                line = None
+            record = AddressRecord.from_line(line) if line else None
             if record:
                 return record
-        return None
+            self._load_index()
+            return self._latest
 
     def backup(self) -> Optional[Path]:
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
@@ -105,9 +195,12 @@ class AddressRepository:
         backup_dir.mkdir(parents=True, exist_ok=True)
         target = backup_dir / f"addresses_{timestamp}.txt"
         try:
+            # Hold the lock for the copy too: a concurrent compaction would
+            # os.replace the file mid-read, which fails outright on Windows.
             with self._lock:
-                data = self._file_path.read_bytes()
-            target.write_bytes(data)
+                if self._index_loaded and self._line_count > len(self._index):
+                    self._compact()
+                shutil.copyfile(self._file_path, target)
             logger.info("Created backup file at %s", target)
             return target
         except OSError as exc:
@@ -116,19 +209,18 @@ class AddressRepository:
 
     def iter_latest(self, limit: int = 10) -> Iterable[AddressRecord]:
         with self._lock:
-            lines = self._file_path.read_text(encoding="utf-8").splitlines()
-        count = 0
-        for line in reversed(lines):
-            if count >= limit:
-                break
-            record = AddressRecord.from_line(line)
-            if record:
-                count += 1
-                yield record
+            self._ensure_index()
+            records = self._sorted_records()
+        yield from reversed(records[-limit:] if limit > 0 else [])
 
     def clear(self) -> None:
         with self._lock:
             self._file_path.write_text("", encoding="utf-8")
+            self._index.clear()
+            self._latest = None
+            self._line_count = 0
+            self._index_loaded = True
+        _parse_line_cached.cache_clear()
         logger.warning("Address repository cleared")
 
 
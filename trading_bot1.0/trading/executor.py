@@ -1,9 +1,14 @@
 ﻿from __future__ import annotations
 
 import asyncio
+import json
+import queue
 import re
+import threading
 import time
-from typing import Optional, Sequence
+import urllib.request
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, Sequence
 
 import pyautogui
 import pyperclip
@@ -13,24 +18,58 @@ from playwright.async_api import (
     Locator,
     Page,
     Playwright,
+    Route,
     TimeoutError as PlaywrightTimeoutError,
     async_playwright,
 )
 from pywinauto import Application, Desktop
 from pywinauto.base_wrapper import BaseWrapper
-from pywinauto.findwindows import ElementNotFoundError
+from pywinauto.findwindows import ElementNotFoundError, find_elements
+
+try:  # pywin32 ships with pywinauto on Windows; pyperclip is the fallback.
+    import pywintypes
+    import win32clipboard
+except ImportError:  # pragma: no cover - non-Windows environments
+    pywintypes = None
+    win32clipboard = None
 
 from config import CONFIG
 from logging_utils.logger import get_logger
+from utils import win_input
 
 
 logger = get_logger(__name__)
 pyautogui.FAILSAFE = False
-pyautogui.PAUSE = 0.05
+# Every step already sleeps or polls explicitly; the implicit per-call pause
+# only added latency to each key chord and click.
+pyautogui.PAUSE = 0
+
+
+class _PriceCharFilter(dict):
+    """str.translate table keeping digits, "." and "-"; built lazily per codepoint."""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isdigit() or char in ".-" else None
+        self[codepoint] = value
+        return value
+
+
+_PRICE_CHARS = _PriceCharFilter()
 
 
 class BinanceTrader:
-    """Executes a full-balance buy on Binance Web3 for the supplied address."""
+    """Executes a full-balance buy on Binance Web3 for the supplied address.
+
+    Intended as a long-lived singleton: the browser, context and GUI worker are
+    kept across trades and only torn down by shutdown() at process exit.
+    """
+
+    _BLOCKED_RESOURCE_TYPES = frozenset(
+        {"image", "font", "media", "beacon", "csp_report", "imageset"}
+    )
+    # Half width/height in pixels of the screen patch polled for UI updates.
+    _PROBE_HALF_SIZE = (80, 16)
 
     def __init__(self) -> None:
         self._config = CONFIG.trade
@@ -39,6 +78,52 @@ class BinanceTrader:
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
         self._lock = asyncio.Lock()
+        self._swap_url_re = re.compile(r"/swap", re.IGNORECASE)
+        # Locators are bound to a page; the cache is reset whenever _page changes.
+        self._locator_cache: dict[str, Locator] = {}
+        # GUI trades run sequentially on one long-lived worker thread.
+        self._gui_jobs: queue.Queue[
+            Optional[tuple[str, asyncio.Future[None]]]
+        ] = queue.Queue()
+        self._gui_thread: Optional[threading.Thread] = None
+        self._cached_chrome_window: Optional[BaseWrapper] = None
+        if self._config.automation_mode == "gui":
+            self._ensure_gui_worker()
+
+    def _ensure_gui_worker(self) -> None:
+        if self._gui_thread and self._gui_thread.is_alive():
+            return
+        self._gui_thread = threading.Thread(
+            target=self._gui_worker,
+            name="BinanceGUI",
+            daemon=True,
+        )
+        self._gui_thread.start()
+
+    def _gui_worker(self) -> None:
+        while True:
+            job = self._gui_jobs.get()
+            if job is None:
+                return
+            address, future = job
+            try:
+                self._execute_gui_flow(address)
+            except BaseException as exc:  # noqa: BLE001
+                # Every outcome must reach the awaiting coroutine or it hangs.
+                _resolve_future_threadsafe(future, _set_future_exception, exc)
+                if not isinstance(exc, Exception):
+                    raise
+            else:
+                _resolve_future_threadsafe(future, _set_future_result, None)
+
+    async def _stop_gui_worker(self) -> None:
+        thread = self._gui_thread
+        if not thread or not thread.is_alive():
+            return
+        self._gui_jobs.put(None)
+        # A job may still be mid-sequence; join off the event loop thread.
+        await asyncio.to_thread(thread.join, 5)
+        self._gui_thread = None
 
     async def _ensure_playwright_started(self) -> None:
         if self._playwright:
@@ -65,12 +150,44 @@ class BinanceTrader:
             self._browser = await self._playwright.chromium.launch(
                 **launch_kwargs,
             )
-            self._context = await self._browser.new_context()
+            context_kwargs: dict[str, object] = {}
+            state_path = self._config.storage_state_path
+            if state_path.exists():
+                # Reuse cookies/localStorage from the previous run to skip re-login.
+                context_kwargs["storage_state"] = str(state_path)
+                logger.info("Restoring browser storage state from %s", state_path)
+            self._context = await self._browser.new_context(**context_kwargs)
 
+        if self._config.block_heavy_assets:
+            # Registered on the context so popups opened during the flow inherit it.
+            # Any route disables Playwright's HTTP cache, so JS bundles are fetched
+            # again on every load; stylesheets always pass so layout and
+            # visibility checks stay correct.
+            await self._context.route("**/*", self._block_heavy_assets)
         self._page = await self._context.new_page()
+        self._locator_cache.clear()
         logger.info("Playwright browser launched")
 
-    async def close(self) -> None:
+    async def _block_heavy_assets(self, route: Route) -> None:
+        if route.request.resource_type in self._BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _save_storage_state(self) -> None:
+        # Persistent contexts keep state in the profile directory already.
+        if not self._context or not self._browser:
+            return
+        state_path = self._config.storage_state_path
+        try:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            await self._context.storage_state(path=str(state_path))
+            logger.info("Saved browser storage state to %s", state_path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to save browser storage state: %s", exc)
+
+    async def shutdown(self) -> None:
+        await self._save_storage_state()
         if self._page:
             await self._page.close()
         if self._context:
@@ -80,20 +197,27 @@ class BinanceTrader:
         if self._playwright:
             await self._playwright.stop()
         self._page = None
+        self._locator_cache.clear()
         self._context = None
         self._browser = None
         self._playwright = None
+        await self._stop_gui_worker()
         logger.info("Trading executor shutdown complete")
 
+    # Kept for existing callers; close() was the full teardown before shutdown().
+    close = shutdown
+
     async def execute_trade(self, address: str) -> None:
-        async with self._lock:
-            mode = self._config.automation_mode
-            if mode == "gui":
-                logger.info("Executing GUI-based trade flow for %s", address)
-                await asyncio.to_thread(self._execute_gui_flow, address)
-                logger.info("GUI trade flow finished for %s", address)
-                return
+        if self._config.automation_mode == "gui":
+            logger.info("Executing GUI-based trade flow for %s", address)
+            self._ensure_gui_worker()
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._gui_jobs.put((address, future))
+            await future
+            logger.info("GUI trade flow finished for %s", address)
+            return
 
+        async with self._lock:
             await self._ensure_playwright_started()
             assert self._page is not None
             await self._navigate()
@@ -104,7 +228,7 @@ class BinanceTrader:
         assert self._page is not None
         url = self._config.binance_trading_url
         logger.info("Navigating to %s", url)
-        await self._page.goto(url, wait_until="networkidle")
+        await self._page.goto(url, wait_until="domcontentloaded")
 
     async def _prepare_trade(self, address: str) -> None:
         if not self._page:
@@ -112,7 +236,8 @@ class BinanceTrader:
         if "markets/trending" not in self._config.binance_trading_url:
             return
         logger.info("Attempting trending page search flow for %s", address)
-        await self._page.wait_for_load_state("networkidle")
+        # Long-poll/WebSocket traffic keeps Binance from ever going networkidle;
+        # the locator wait below is the real readiness signal.
         search_input = await self._locate_first_visible(
             self._config.trending_search_input_selectors,
             timeout=6000,
@@ -167,7 +292,7 @@ class BinanceTrader:
         if self._config.swap_url_template:
             target = self._config.swap_url_template.format(address=address)
             logger.info("Falling back to direct swap URL %s", target)
-            await self._page.goto(target, wait_until="networkidle")
+            await self._page.goto(target, wait_until="domcontentloaded")
             await self._switch_to_last_page()
             await self._wait_for_swap_url()
         else:
@@ -208,22 +333,60 @@ class BinanceTrader:
         selectors: Sequence[str],
         *,
         timeout: int = 5000,
+    ) -> Optional[Locator]:
+        return await self._race_selectors(
+            selectors,
+            lambda locator: locator.wait_for(state="visible", timeout=timeout),
+        )
+
+    async def _race_selectors(
+        self,
+        selectors: Sequence[str],
+        action: Callable[[Locator], Awaitable[None]],
     ) -> Optional[Locator]:
         if not selectors:
             return None
         if not self._page:
             return None
-        for selector in selectors:
-            locator = self._page.locator(selector).first
+
+        async def probe(selector: str) -> Optional[Locator]:
+            locator = self._cached_locator(selector)
             try:
-                await locator.wait_for(state="visible", timeout=timeout)
+                await action(locator)
                 return locator
             except PlaywrightTimeoutError:
-                continue
+                return None
             except Exception as exc:  # noqa: BLE001
                 logger.debug("Selector %s raised %s", selector, exc)
-                continue
-        return None
+                return None
+
+        # Probe every selector concurrently so misses cost one timeout, not N.
+        tasks = [asyncio.create_task(probe(selector)) for selector in selectors]
+        pending: set[asyncio.Task[Optional[Locator]]] = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                # Prefer the earliest-listed selector among those that just resolved.
+                for task in tasks:
+                    if task in done and task.result() is not None:
+                        return task.result()
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _cached_locator(self, selector: str) -> Locator:
+        assert self._page is not None
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._page.locator(selector).first
+            self._locator_cache[selector] = locator
+        return locator
 
     async def _fill_locator(self, locator: Locator, value: str) -> None:
         if not self._page:
@@ -247,20 +410,31 @@ class BinanceTrader:
         selectors: Sequence[str],
         description: str,
     ) -> None:
-        locator = await self._locate_first_visible(selectors, timeout=10_000)
+        # Race trial clicks (actionability checks only) so that overlapping
+        # selectors can never click twice, then click the winner normally: the
+        # checks are re-run, which returns at once when it is still actionable
+        # and waits if it re-rendered disabled meanwhile (e.g. quote loading).
+        locator = await self._race_selectors(
+            selectors,
+            lambda candidate: candidate.click(trial=True, timeout=10_000),
+        )
         if not locator:
             raise RuntimeError(
                 f"Failed to locate {description} using selectors {selectors}"
             )
-        await locator.click()
+        await locator.click(timeout=10_000)
         await self._switch_to_last_page()
 
-    async def _wait_for_swap_url(self, timeout: int = 8000) -> bool:
+    def _current_is_swap(self) -> bool:
+        return bool(self._page and self._swap_url_re.search(self._page.url))
+
+    async def _wait_for_swap_url(self, timeout: int = 3000) -> bool:
         if not self._page:
             return False
-        pattern = re.compile(r"/swap", re.IGNORECASE)
+        if self._current_is_swap():
+            return True
         try:
-            await self._page.wait_for_url(pattern, timeout=timeout)
+            await self._page.wait_for_url(self._swap_url_re, timeout=timeout)
             return True
         except PlaywrightTimeoutError:
             return False
@@ -271,7 +445,7 @@ class BinanceTrader:
         if self._config.swap_url_template:
             target = self._config.swap_url_template.format(address=address)
             logger.info("Navigating directly to swap page %s", target)
-            await self._page.goto(target, wait_until="networkidle")
+            await self._page.goto(target, wait_until="domcontentloaded")
             await self._switch_to_last_page()
             await self._wait_for_swap_url(timeout=5000)
 
@@ -284,6 +458,7 @@ class BinanceTrader:
         current = pages[-1]
         if current is not self._page:
             self._page = current
+            self._locator_cache.clear()
             try:
                 await current.wait_for_load_state()
             except PlaywrightTimeoutError:
@@ -312,12 +487,21 @@ class BinanceTrader:
             clicks=1,
             pause=0.1,
         )
-        pyautogui.hotkey("ctrl", "a")
-        pyautogui.hotkey("ctrl", "v")
+        self._send_hotkeys(("ctrl", "a"), ("ctrl", "v"))
         logger.info("Pasted address into Binance search input")
-        time.sleep(4.5)
+        # Baseline only after the paste: focusing the field can open a dropdown
+        # of trending tokens, which must not count as the search result.
+        result_baseline = self._grab_probe_region(cfg.chrome_result_row_point)
+        self._wait_for_region_update(
+            cfg.chrome_result_row_point,
+            result_baseline,
+            timeout=4.5,
+            min_dwell=1.5,
+            description="search result row",
+        )
 
         # Step 2: click search result row
+        price_baseline = self._grab_probe_region(cfg.chrome_price_field_point)
         self._click_absolute_point(
             cfg.chrome_result_row_point,
             "search result row",
@@ -325,18 +509,18 @@ class BinanceTrader:
             pause=0.1,
         )
         logger.info("Selected token via fixed search row")
-        time.sleep(2.5)
-
-        # Step 3: copy price, adjust, copy back
-        self._click_absolute_point(
+        self._wait_for_region_update(
             cfg.chrome_price_field_point,
-            "price field",
-            clicks=2,
-            pause=0.1,
+            price_baseline,
+            timeout=2.5,
+            min_dwell=1.0,
+            description="price field",
         )
-        pyautogui.hotkey("ctrl", "c")
-        time.sleep(0.05)
-        raw_value = pyperclip.paste()
+
+        # Step 3: read price (API when configured, else copy from page), adjust, copy back
+        raw_value = self._fetch_price_via_api(address)
+        if raw_value is None:
+            raw_value = self._copy_price_from_page()
         adjusted_value = self._adjust_price_value(raw_value)
         self._copy_to_clipboard(adjusted_value)
         logger.info("Copied price %s and adjusted to %s", raw_value, adjusted_value)
@@ -348,8 +532,7 @@ class BinanceTrader:
             clicks=1,
             pause=0.1,
         )
-        pyautogui.hotkey("ctrl", "a")
-        pyautogui.hotkey("ctrl", "v")
+        self._send_hotkeys(("ctrl", "a"), ("ctrl", "v"))
         logger.info("Pasted adjusted quantity %s", adjusted_value)
         time.sleep(0.5)
 
@@ -369,9 +552,113 @@ class BinanceTrader:
             pause=0.2,
         )
         logger.info("Clicked back button point")
-        pyautogui.hotkey("alt", "left")
+        self._send_hotkeys(("alt", "left"))
         logger.info("Triggered browser back shortcut")
 
+    def _wait_until(
+        self,
+        predicate: Callable[[], bool],
+        timeout: float,
+        interval: float = 0.05,
+    ) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if predicate():
+                    return True
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Wait predicate raised %s", exc)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+
+    def _grab_probe_region(self, point: tuple[int, int]) -> Optional[bytes]:
+        x, y = point
+        half_width, half_height = self._PROBE_HALF_SIZE
+        region = (
+            max(0, x - half_width),
+            max(0, y - half_height),
+            half_width * 2,
+            half_height * 2,
+        )
+        try:
+            return pyautogui.screenshot(region=region).tobytes()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Unable to capture probe region at %s: %s", point, exc)
+            return None
+
+    def _wait_for_region_update(
+        self,
+        point: tuple[int, int],
+        baseline: Optional[bytes],
+        *,
+        timeout: float,
+        min_dwell: float,
+        description: str,
+        stable_polls: int = 3,
+    ) -> None:
+        # Ready once the pixels around ``point`` have changed, then held still for
+        # ``stable_polls`` consecutive polls, and at least ``min_dwell`` seconds
+        # have passed; spinners and skeleton rows change again before settling.
+        # ``timeout`` is the old fixed sleep, so the worst case is unchanged.
+        if baseline is None:
+            time.sleep(timeout)
+            return
+        started = time.monotonic()
+        previous = baseline
+        changed = False
+        unchanged = 0
+
+        def settled() -> bool:
+            nonlocal previous, changed, unchanged
+            current = self._grab_probe_region(point)
+            if current is None:
+                return False
+            if current != previous:
+                changed = True
+                previous = current
+                unchanged = 0
+                return False
+            unchanged += 1
+            return (
+                changed
+                and unchanged >= stable_polls
+                and time.monotonic() - started >= min_dwell
+            )
+
+        if self._wait_until(settled, timeout, interval=0.1):
+            logger.debug(
+                "%s updated after %.2fs",
+                description,
+                time.monotonic() - started,
+            )
+        else:
+            logger.debug("%s did not settle within %.1fs", description, timeout)
+
+    def _copy_price_from_page(self, attempts: int = 3) -> str:
+        # A price that is still loading shows as "--" or blank; copying that
+        # would size the order from 0, so retry and give up rather than buy.
+        cfg = self._config
+        for attempt in range(attempts):
+            self._click_absolute_point(
+                cfg.chrome_price_field_point,
+                "price field",
+                clicks=2,
+                pause=0.1,
+            )
+            raw_value = self._copy_selection()
+            if self._parse_price(raw_value) > 0:
+                return raw_value
+            logger.warning(
+                "Price field not ready (attempt %s/%s): %r",
+                attempt + 1,
+                attempts,
+                raw_value[:32],
+            )
+            time.sleep(0.3)
+        raise RuntimeError("Price field did not show a numeric price; aborting trade")
+
     def _navigate_existing_chrome(self, window: BaseWrapper, url: str) -> None:
         self._copy_to_clipboard(url)
         self._click_window_ratio(
@@ -381,9 +668,7 @@ class BinanceTrader:
             clicks=2,
             pause=0.3,
         )
-        pyautogui.hotkey("ctrl", "a")
-        pyautogui.hotkey("ctrl", "v")
-        pyautogui.press("enter")
+        self._send_hotkeys(("ctrl", "a"), ("ctrl", "v"), ("enter",))
         logger.info("Chrome navigation triggered for %s", url)
         time.sleep(max(0.8, self._config.chrome_page_load_seconds))
 
@@ -407,8 +692,7 @@ class BinanceTrader:
                 clicks=1,
                 pause=0.1,
             )
-            pyautogui.hotkey("ctrl", "a")
-            pyautogui.hotkey("ctrl", "v")
+            self._send_hotkeys(("ctrl", "a"), ("ctrl", "v"))
             logger.info("Address pasted via absolute field")
             time.sleep(0.2)
             self._click_absolute_point(
@@ -428,8 +712,7 @@ class BinanceTrader:
             clicks=2,
             pause=0.2,
         )
-        pyautogui.hotkey("ctrl", "a")
-        pyautogui.hotkey("ctrl", "v")
+        self._send_hotkeys(("ctrl", "a"), ("ctrl", "v"))
         logger.info("Address pasted into search field")
         time.sleep(max(0.7, self._config.chrome_result_wait_seconds))
         self._click_window_ratio(
@@ -449,19 +732,17 @@ class BinanceTrader:
                 clicks=2,
                 pause=0.1,
             )
-            pyautogui.hotkey("ctrl", "c")
+            copied = self._copy_selection()
             logger.debug("Copied current price via absolute point")
-            time.sleep(0.05)
-            adjusted = self._adjust_price_value(pyperclip.paste())
-            pyperclip.copy(adjusted)
+            adjusted = self._adjust_price_value(copied)
+            self._copy_to_clipboard(adjusted)
             self._click_absolute_point(
                 self._config.chrome_quantity_field_point,
                 "quantity input",
                 clicks=1,
                 pause=0.1,
             )
-            pyautogui.hotkey("ctrl", "a")
-            pyautogui.hotkey("ctrl", "v")
+            self._send_hotkeys(("ctrl", "a"), ("ctrl", "v"))
             logger.info("Pasted adjusted price %s into quantity input", adjusted)
             time.sleep(0.1)
             return
@@ -473,9 +754,8 @@ class BinanceTrader:
             clicks=2,
             pause=0.2,
         )
-        pyautogui.hotkey("ctrl", "c")
+        self._copy_selection()
         logger.info("Copied current price")
-        time.sleep(0.2)
         self._click_window_ratio(
             window,
             self._config.chrome_quantity_input_ratio,
@@ -483,7 +763,7 @@ class BinanceTrader:
             clicks=2,
             pause=0.2,
         )
-        pyautogui.hotkey("ctrl", "v")
+        self._send_hotkeys(("ctrl", "v"))
         logger.info("Pasted price into quantity input")
         time.sleep(0.3)
 
@@ -513,14 +793,26 @@ class BinanceTrader:
         logger.info("Clicked confirm button")
 
     def _focus_chrome_window(self) -> BaseWrapper:
+        cached = self._cached_chrome_window
+        if cached is not None:
+            try:
+                if cached.is_visible():
+                    cached.set_focus()
+                    return cached
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Cached Chrome window no longer usable: %s", exc)
+            self._cached_chrome_window = None
         try:
             last_error: ElementNotFoundError | None = None
-            for pattern in self._candidate_chrome_title_patterns():
+            patterns = _candidate_chrome_title_patterns(
+                self._config.chrome_window_title_pattern.strip()
+            )
+            for pattern in patterns:
                 try:
                     return self._connect_window(title_re=pattern)
                 except ElementNotFoundError as exc:
                     last_error = exc
-                    logger.debug("Chrome window not found via pattern %s", pattern)
+                    logger.debug("Chrome window not found via pattern %s", pattern.pattern)
 
             titles = self._list_chrome_windows()
             logger.error("Chrome windows currently visible: %s", titles or "none")
@@ -536,8 +828,13 @@ class BinanceTrader:
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError("Failed to focus Chrome window") from exc
 
-    def _connect_window(self, *, title: str | None = None, title_re: str | None = None) -> BaseWrapper:
-        kwargs: dict[str, str] = {}
+    def _connect_window(
+        self,
+        *,
+        title: str | None = None,
+        title_re: str | re.Pattern[str] | None = None,
+    ) -> BaseWrapper:
+        kwargs: dict[str, str | re.Pattern[str]] = {}
         if title:
             kwargs["title"] = title
         if title_re:
@@ -545,11 +842,26 @@ class BinanceTrader:
         app = Application(backend="uia").connect(**kwargs)
         window = app.window(**kwargs)
         window.set_focus()
-        window.set_focus()
-        time.sleep(0.2)
+        # Only wait as long as it takes Windows to report Chrome as foreground.
+        self._wait_until(window.is_active, timeout=0.2, interval=0.02)
+        self._cached_chrome_window = window
         return window
 
     def _list_chrome_windows(self) -> list[str]:
+        # Pre-filter by Chrome's window class in one UIA query; element names
+        # come back with the search, so no per-window window_text() round trip.
+        try:
+            elements = find_elements(class_name="Chrome_WidgetWin_1", backend="uia")
+        except Exception:  # noqa: BLE001
+            elements = []
+        titles = [
+            element.name
+            for element in elements
+            if element.name
+            and ("chrome" in element.name.lower() or "binance" in element.name.lower())
+        ]
+        if titles:
+            return titles
         try:
             desktop = Desktop(backend="uia")
             titles = []
@@ -579,8 +891,7 @@ class BinanceTrader:
         height = rect.bottom - rect.top
         x = rect.left + int(width * ratio[0])
         y = rect.top + int(height * ratio[1])
-        pyautogui.moveTo(x, y, duration=0.1)
-        pyautogui.click(x=x, y=y, clicks=clicks, interval=0.05)
+        self._send_click(x, y, clicks)
         logger.debug("Clicked %s at (%s, %s)", description, x, y)
         time.sleep(pause)
 
@@ -593,43 +904,201 @@ class BinanceTrader:
         pause: float = 0.1,
     ) -> None:
         x, y = point
-        pyautogui.moveTo(x, y, duration=0.05)
-        pyautogui.click(x=x, y=y, clicks=clicks, interval=0.04)
+        self._send_click(x, y, clicks)
         logger.debug("Clicked %s at absolute point (%s, %s)", description, x, y)
         time.sleep(pause)
 
-    def _adjust_price_value(self, raw_value: str) -> str:
+    # win_input.send raises OSError only when nothing was injected, so the
+    # pyautogui replay cannot double up input. A partial send raises
+    # PartialSendError, which fails the trade so it is retried from the start.
+    def _send_click(self, x: int, y: int, clicks: int = 1) -> None:
+        if win_input.available():
+            try:
+                win_input.send(win_input.click_events(x, y, clicks))
+                return
+            except OSError as exc:
+                logger.debug("SendInput click failed, falling back to pyautogui: %s", exc)
+        pyautogui.click(x=x, y=y, clicks=clicks, interval=0.04)
+
+    def _send_hotkeys(self, *chords: tuple[str, ...]) -> None:
+        if win_input.available():
+            events = []
+            for chord in chords:
+                events.extend(win_input.hotkey_events(*chord))
+            try:
+                win_input.send(events)
+                return
+            except OSError as exc:
+                logger.debug("SendInput hotkeys failed, falling back to pyautogui: %s", exc)
+        for chord in chords:
+            pyautogui.hotkey(*chord)
+
+    def _fetch_price_via_api(self, address: str) -> Optional[str]:
+        template = self._config.price_api_url_template
+        if not template:
+            return None
+        try:
+            url = template.format(address=address)
+        except (KeyError, IndexError, ValueError) as exc:
+            logger.warning("Invalid price API URL template %r: %s", template, exc)
+            return None
+        request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+        try:
+            with urllib.request.urlopen(
+                request,
+                timeout=self._config.price_api_timeout_seconds,
+            ) as response:
+                payload = json.load(response)
+        except (OSError, ValueError) as exc:
+            logger.warning("Price API request failed for %s: %s", address, exc)
+            return None
+
+        value: object = payload
+        json_path = self._config.price_api_json_path
+        for key in filter(None, json_path.split(".")):
+            if isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            elif isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                logger.warning("Price API response has no %r for %s", json_path, address)
+                return None
+        if value is None or isinstance(value, (dict, list)):
+            logger.warning("Price API returned non-scalar %r for %s", json_path, address)
+            return None
+        if self._parse_price(str(value)) <= 0:
+            logger.warning("Price API returned non-positive price %r for %s", value, address)
+            return None
+        logger.info("Fetched price %s for %s via API", value, address)
+        return str(value)
+
+    @staticmethod
+    def _parse_price(raw_value: str) -> float:
         cleaned = raw_value.replace(",", "").strip()
-        digits = "".join(ch for ch in cleaned if ch.isdigit() or ch in ".-")
+        digits = cleaned.translate(_PRICE_CHARS)
         try:
-            value = float(digits)
+            return float(digits)
         except ValueError:
-            value = 0.0
+            return 0.0
+
+    def _adjust_price_value(self, raw_value: str) -> str:
+        value = self._parse_price(raw_value)
         adjusted = max(0.0, value - self._config.chrome_price_offset)
         return f"{adjusted:.6f}"
 
     def _copy_to_clipboard(self, text: str) -> None:
-        for _ in range(3):
-            pyperclip.copy(text)
-            if pyperclip.paste() == text:
+        if win32clipboard is None:
+            for _ in range(3):
+                pyperclip.copy(text)
+                if pyperclip.paste() == text:
+                    return
+                time.sleep(0.1)
+                logger.warning("Clipboard content mismatch while setting %s", text[:8])
+            return
+
+        # We own the write, so there is no read-back round trip; retry once in
+        # case another process briefly holds the clipboard open.
+        for attempt in range(2):
+            try:
+                win32clipboard.OpenClipboard()
+                try:
+                    win32clipboard.EmptyClipboard()
+                    win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
+                finally:
+                    win32clipboard.CloseClipboard()
                 return
-            time.sleep(0.1)
-            logger.warning("Clipboard content mismatch while setting %s", text[:8])
-
-    def _candidate_chrome_title_patterns(self) -> tuple[str, ...]:
-        requested = self._config.chrome_window_title_pattern.strip()
-        defaults = (
-            r"(BSC 甯傚満涓婄殑鐑棬浠ｅ竵鍜?Meme 甯?\| 甯佸畨閽卞寘 - Google Chrome)",
-            r"(BSC 甯傚満涓婄殑鐑棬浠ｅ竵)|Binance Web3",
-            r"Binance Web3",
-            r"Binance",
-            r"Google Chrome",
-        )
-        patterns: list[str] = []
-        if requested:
-            patterns.append(requested)
-        for pattern in defaults:
-            if pattern and pattern not in patterns:
-                patterns.append(pattern)
-        return tuple(patterns)
+            except pywintypes.error as exc:
+                logger.warning(
+                    "Clipboard busy while setting %s (attempt %s): %s",
+                    text[:8],
+                    attempt + 1,
+                    exc,
+                )
+                time.sleep(0.05)
+        pyperclip.copy(text)
+
+    def _copy_selection(self, timeout: float = 1.0) -> str:
+        # Chrome fills the clipboard asynchronously after Ctrl+C, and it still
+        # holds the token address copied earlier; parsing that as a price would
+        # size a huge order. Only read once the clipboard has really changed.
+        if win32clipboard is not None:
+            before = win32clipboard.GetClipboardSequenceNumber()
+            self._send_hotkeys(("ctrl", "c"))
+            changed = self._wait_until(
+                lambda: win32clipboard.GetClipboardSequenceNumber() != before,
+                timeout,
+                interval=0.01,
+            )
+        else:
+            previous = self._read_clipboard()
+            self._send_hotkeys(("ctrl", "c"))
+            changed = self._wait_until(
+                lambda: pyperclip.paste() != previous,
+                timeout,
+                interval=0.02,
+            )
+        if not changed:
+            logger.warning("Clipboard did not change within %.1fs after copy", timeout)
+            return ""
+        return self._read_clipboard()
+
+    def _read_clipboard(self) -> str:
+        if win32clipboard is None:
+            return pyperclip.paste()
+        try:
+            win32clipboard.OpenClipboard()
+            try:
+                return win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+            finally:
+                win32clipboard.CloseClipboard()
+        except (pywintypes.error, TypeError) as exc:
+            logger.debug("Unable to read clipboard text: %s", exc)
+            return ""
+
+
+@lru_cache(maxsize=4)
+def _candidate_chrome_title_patterns(requested: str) -> tuple[re.Pattern[str], ...]:
+    # pywinauto runs title_re through re.compile, which returns an already
+    # compiled pattern unchanged, so compiling here happens once per config value.
+    defaults = (
+        r"(BSC 甯傚満涓婄殑鐑棬浠ｅ竵鍜?Meme 甯?\| 甯佸畨閽卞寘 - Google Chrome)",
+        r"(BSC 甯傚満涓婄殑鐑棬浠ｅ竵)|Binance Web3",
+        r"Binance Web3",
+        r"Binance",
+        r"Google Chrome",
+    )
+    patterns: list[str] = []
+    if requested:
+        patterns.append(requested)
+    for pattern in defaults:
+        if pattern and pattern not in patterns:
+            patterns.append(pattern)
+    compiled: list[re.Pattern[str]] = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern))
+        except re.error as exc:
+            logger.warning("Ignoring invalid Chrome title pattern %r: %s", pattern, exc)
+    return tuple(compiled)
+
+
+def _resolve_future_threadsafe(
+    future: asyncio.Future[None],
+    setter: Callable[[asyncio.Future[None], object], None],
+    value: object,
+) -> None:
+    try:
+        future.get_loop().call_soon_threadsafe(setter, future, value)
+    except RuntimeError as exc:
+        # The loop closed while the GUI job ran; nobody is awaiting any more.
+        logger.debug("Dropping GUI job result, event loop closed: %s", exc)
+
+
+def _set_future_result(future: asyncio.Future[None], result: None) -> None:
+    if not future.done():
+        future.set_result(result)
+
 
+def _set_future_exception(future: asyncio.Future[None], exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
 import re
-from typing import Sequence
+import shlex
+from pathlib import Path
+from typing import Any, Optional, Sequence
 
 import numpy as np
 import pytesseract
 from pytesseract import TesseractNotFoundError
 from PIL import Image
 
+from logging_utils.logger import get_logger
+
+try:  # Optional in-process libtesseract binding; pytesseract is the fallback.
+    import tesserocr
+except ImportError:  # pragma: no cover - depends on environment
+    tesserocr = None
+
+# Separator bytes the loose pattern tolerates between address characters.
+_WHITESPACE_BYTES = b" \t\n\r\f\v\x1c\x1d\x1e\x1f"
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+logger = get_logger(__name__)
+
 
 class OcrEngine:
     """Lightweight OCR wrapper using pytesseract."""
@@ -15,25 +30,110 @@ class OcrEngine:
     def __init__(
         self,
         *,
-        address_pattern: str = r"0[xX][a-fA-F0-9]{40}",
+        address_pattern: str | re.Pattern[str] = r"0[xX][a-fA-F0-9]{40}",
         tesseract_cmd: str | None = None,
         language: str = "eng",
+        tesseract_config: str = "",
+        max_width: int = 0,
     ) -> None:
         if tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
         self.address_pattern = re.compile(address_pattern)
+        # Matching runs on the ASCII-encoded OCR text, so keep bytes twins of the
+        # patterns; bytes ``\s`` omits \x1c-\x1f, which str ``\s`` accepts.
+        self._address_pattern_bytes = re.compile(
+            self.address_pattern.pattern.encode("utf-8"),
+            self.address_pattern.flags & ~re.UNICODE,
+        )
         self._loose_address_pattern = re.compile(
-            r"0\s*[xX](?:\s*[0-9a-fA-F]){40}"
+            rb"0[\s\x1c-\x1f]*[xX](?:[\s\x1c-\x1f]*[0-9a-fA-F]){40}"
         )
         self._language = language
+        self._tesseract_config = tesseract_config
+        self._max_width = max(0, max_width)
+        self._ready: Optional[bool] = None
+        self._tesseract_cmd = tesseract_cmd
+        self._api: Any = None
+        self._api_failed = tesserocr is None
+
+    def _tesserocr_api(self) -> Any:
+        # One PyTessBaseAPI is reused for every frame, avoiding a tesseract
+        # process spawn and a temp image file per OCR call.
+        if self._api is not None or self._api_failed:
+            return self._api
+        try:
+            psm, variables = self._parse_tesseract_config(self._tesseract_config)
+        except (ValueError, StopIteration):
+            logger.info(
+                "TESSERACT_CONFIG %r is not supported by tesserocr; using pytesseract",
+                self._tesseract_config,
+            )
+            self._api_failed = True
+            return None
+        kwargs: dict[str, Any] = {"lang": self._language}
+        if self._tesseract_cmd:
+            tessdata = Path(self._tesseract_cmd).parent / "tessdata"
+            if tessdata.is_dir():
+                kwargs["path"] = str(tessdata)
+        try:
+            api = tesserocr.PyTessBaseAPI(**kwargs)
+            if psm is not None:
+                api.SetPageSegMode(psm)
+            for name, value in variables:
+                api.SetVariable(name, value)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("tesserocr unavailable, falling back to pytesseract: %s", exc)
+            self._api_failed = True
+            return None
+        self._api = api
+        return api
+
+    @staticmethod
+    def _parse_tesseract_config(config: str) -> tuple[Optional[int], list[tuple[str, str]]]:
+        psm: Optional[int] = None
+        variables: list[tuple[str, str]] = []
+        tokens = iter(shlex.split(config))
+        for token in tokens:
+            if token == "--psm":
+                psm = int(next(tokens))
+            elif token == "-c":
+                name, _, value = next(tokens).partition("=")
+                variables.append((name, value))
+            else:
+                raise ValueError(token)
+        return psm, variables
+
+    @property
+    def uses_subprocess(self) -> bool:
+        return self._tesserocr_api() is None
+
+    def close(self) -> None:
+        if self._api is None:
+            return
+        try:
+            self._api.End()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to release tesserocr API: %s", exc)
+        self._api = None
 
     def is_ready(self) -> bool:
+        # get_tesseract_version() spawns the binary; only a success is cached so
+        # a later install is still picked up.
+        if self._ready:
+            return True
+        if self._tesserocr_api() is not None:
+            self._ready = True
+            return True
         try:
             pytesseract.get_tesseract_version()
         except (TesseractNotFoundError, FileNotFoundError):
             return False
+        self._ready = True
         return True
 
+    def invalidate_ready(self) -> None:
+        self._ready = None
+
     def ensure_ready(self) -> None:
         if not self.is_ready():
             raise RuntimeError(
@@ -41,30 +141,48 @@ class OcrEngine:
             )
 
     def run_ocr(self, image: np.ndarray) -> str:
+        if image.ndim == 3:
+            image = (image[..., :3] @ _LUMA_WEIGHTS).astype(np.uint8)
         pil_image = Image.fromarray(image)
-        return pytesseract.image_to_string(pil_image, lang=self._language)
+        if self._max_width and pil_image.width > self._max_width:
+            # Tesseract time scales with pixel count; shrink by an integer box factor.
+            factor = -(-pil_image.width // self._max_width)
+            pil_image = pil_image.reduce(factor)
+        api = self._tesserocr_api()
+        if api is not None:
+            pixels = np.ascontiguousarray(np.asarray(pil_image, dtype=np.uint8))
+            height, width = pixels.shape
+            api.SetImageBytes(pixels.tobytes(), width, height, 1, width)
+            return api.GetUTF8Text()
+        # pytesseract hands the image to tesseract through a temp file in the
+        # image's own format (PNG when unset); uncompressed BMP skips the deflate.
+        pil_image.format = "BMP"
+        return pytesseract.image_to_string(
+            pil_image,
+            lang=self._language,
+            config=self._tesseract_config,
+        )
 
-    def extract_addresses(self, text: str) -> Sequence[str]:
+    def extract_addresses(self, text: str | bytes) -> Sequence[bytes]:
         if not text:
             return []
-        addresses = list(dict.fromkeys(self.address_pattern.findall(text)))
+        if isinstance(text, str):
+            # "?" stands in for non-ASCII characters so they still break matches.
+            text = text.encode("ascii", errors="replace")
+        addresses = list(
+            dict.fromkeys(
+                match.group(0).lower()
+                for match in self._address_pattern_bytes.finditer(text)
+            )
+        )
         if addresses:
-            return [addr.lower() for addr in addresses]
-
-        loose_matches = self._loose_address_pattern.finditer(text)
-        normalized: list[str] = []
-        seen: set[str] = set()
-        for match in loose_matches:
-            raw = match.group(0)
-            cleaned = re.sub(r"\s+", "", raw).lower()
-            if len(cleaned) != 42:
-                continue
-            if not cleaned.startswith("0x"):
-                continue
-            hex_part = cleaned[2:]
-            if not all(ch in "0123456789abcdef" for ch in hex_part):
-                continue
-            if cleaned not in seen:
-                seen.add(cleaned)
-                normalized.append(cleaned)
-        return normalized
+            return addresses
+
+        # The loose pattern only admits hex digits between separators, so once
+        # the separators are stripped every match is already a valid address.
+        return list(
+            dict.fromkeys(
+                match.group(0).translate(None, _WHITESPACE_BYTES).lower()
+                for match in self._loose_address_pattern.finditer(text)
+            )
+        )
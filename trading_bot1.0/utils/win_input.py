@@ -0,0 +1,179 @@
+"""Batched Win32 SendInput helpers for the GUI trade flow."""
+from __future__ import annotations
+
+import ctypes
+import sys
+from ctypes import wintypes
+from typing import Sequence
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_ABSOLUTE = 0x8000
+KEYEVENTF_KEYUP = 0x0002
+
+SM_CXSCREEN = 0
+SM_CYSCREEN = 1
+
+# pyautogui-style key names used by the executor; single characters map to
+# their upper-case virtual-key code.
+VIRTUAL_KEYS = {
+    "ctrl": 0x11,
+    "alt": 0x12,
+    "shift": 0x10,
+    "enter": 0x0D,
+    "left": 0x25,
+}
+
+ULONG_PTR = wintypes.WPARAM
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+
+class PartialSendError(RuntimeError):
+    """SendInput injected only part of a batch; held keys and buttons were released."""
+
+
+if sys.platform == "win32":
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+else:  # pragma: no cover - GUI automation is Windows-only
+    _user32 = None
+
+
+def available() -> bool:
+    return _user32 is not None
+
+
+def _virtual_key(name: str) -> int:
+    key = VIRTUAL_KEYS.get(name.lower())
+    if key is not None:
+        return key
+    if len(name) == 1:
+        return ord(name.upper())
+    raise ValueError(f"Unsupported key name {name!r}")
+
+
+def _key_event(vk: int, flags: int = 0) -> INPUT:
+    event = INPUT(type=INPUT_KEYBOARD)
+    event.union.ki = KEYBDINPUT(wVk=vk, wScan=0, dwFlags=flags, time=0, dwExtraInfo=0)
+    return event
+
+
+def _mouse_event(flags: int, dx: int = 0, dy: int = 0) -> INPUT:
+    event = INPUT(type=INPUT_MOUSE)
+    event.union.mi = MOUSEINPUT(
+        dx=dx,
+        dy=dy,
+        mouseData=0,
+        dwFlags=flags,
+        time=0,
+        dwExtraInfo=0,
+    )
+    return event
+
+
+def hotkey_events(*keys: str) -> list[INPUT]:
+    """Key-down for each key in order, then key-up in reverse, like pyautogui.hotkey."""
+    codes = [_virtual_key(key) for key in keys]
+    events = [_key_event(code) for code in codes]
+    events.extend(_key_event(code, KEYEVENTF_KEYUP) for code in reversed(codes))
+    return events
+
+
+def click_events(x: int, y: int, clicks: int = 1) -> list[INPUT]:
+    """Absolute move to ``(x, y)`` on the primary screen followed by left clicks."""
+    assert _user32 is not None
+    width = _user32.GetSystemMetrics(SM_CXSCREEN)
+    height = _user32.GetSystemMetrics(SM_CYSCREEN)
+    # Absolute coordinates are normalised to 0..65535 across the primary screen.
+    dx = (x * 65536 + width - 1) // max(1, width)
+    dy = (y * 65536 + height - 1) // max(1, height)
+    events = [_mouse_event(MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE, dx, dy)]
+    for _ in range(max(1, clicks)):
+        events.append(_mouse_event(MOUSEEVENTF_LEFTDOWN))
+        events.append(_mouse_event(MOUSEEVENTF_LEFTUP))
+    return events
+
+
+def _release_events(events: Sequence[INPUT]) -> list[INPUT]:
+    """Key-up for every key in ``events`` (reverse order), plus left-up if it clicked."""
+    releases: list[INPUT] = []
+    seen: set[int] = set()
+    pressed_button = False
+    for event in reversed(events):
+        if event.type == INPUT_KEYBOARD:
+            vk = event.union.ki.wVk
+            if vk not in seen:
+                seen.add(vk)
+                releases.append(_key_event(vk, KEYEVENTF_KEYUP))
+        elif event.type == INPUT_MOUSE and event.union.mi.dwFlags & MOUSEEVENTF_LEFTDOWN:
+            pressed_button = True
+    if pressed_button:
+        releases.append(_mouse_event(MOUSEEVENTF_LEFTUP))
+    return releases
+
+
+def send(events: Sequence[INPUT]) -> None:
+    """Inject all events with a single SendInput call.
+
+    Raises ``OSError`` when nothing was injected, so callers may safely replay
+    the input another way. A partial injection releases everything the batch
+    could have left held down and raises ``PartialSendError`` instead, since
+    replaying it would repeat the part that already landed.
+    """
+    if not events:
+        return
+    if _user32 is None:
+        raise OSError("SendInput is only available on Windows")
+    batch = (INPUT * len(events))(*events)
+    sent = _user32.SendInput(len(events), batch, ctypes.sizeof(INPUT))
+    if sent == len(events):
+        return
+    error = ctypes.get_last_error()
+    if sent == 0:
+        raise ctypes.WinError(error)
+    releases = _release_events(events)
+    if releases:
+        release_batch = (INPUT * len(releases))(*releases)
+        _user32.SendInput(len(releases), release_batch, ctypes.sizeof(INPUT))
+    raise PartialSendError(
+        f"SendInput injected {sent} of {len(events)} events (error {error})"
+    )
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import os
+import queue
+import string
 import threading
 import time
 import unicodedata
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Optional, Sequence, Tuple
+from typing import Callable, Collection, Optional, Sequence, Tuple
 
 import cv2
+import mss
 import numpy as np
-import pyautogui
 import re
 from pywinauto import Application, Desktop
 from pywinauto.base_wrapper import BaseWrapper
@@ -21,16 +27,37 @@ from logging_utils.logger import get_logger
 from storage.address_repo import AddressRepository, AddressRecord, create_record
 from utils.ocr_engine import OcrEngine
 
+try:  # pywin32 ships with pywinauto on Windows.
+    import win32gui
+except ImportError:  # pragma: no cover - non-Windows environments
+    win32gui = None
+
 
 logger = get_logger(__name__)
-pyautogui.FAILSAFE = False
-pyautogui.PAUSE = 0.0
+_ADDRESS_RE = re.compile(rb"0x[0-9a-f]{40}")
+_UPPER_TO_LOWER = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"),
+    string.ascii_lowercase.encode("ascii"),
+)
+# White rows inserted between batched frames so tesseract keeps their lines apart.
+_BATCH_SEPARATOR_HEIGHT = 10
+# A trade is suppressed when its address is among this many most recent ones.
+_RECENT_RANK = 3
+# GetAncestor flag for the top-level window that owns a handle.
+_GA_ROOT = 2
 
 
 class WindowNotFoundError(RuntimeError):
     pass
 
 
+class _LatestFrameQueue(queue.Queue):
+    """queue.Queue that keeps only the most recently captured frame."""
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = deque(maxlen=1)
+
+
 class WeChatOCRListener:
     """Continuously captures a region of the WeChat window and extracts BSC addresses."""
 
@@ -43,18 +70,50 @@ class WeChatOCRListener:
         self._config = CONFIG.ocr
         self._repo = repository
         self._on_new_record = on_new_record
+        # Candidates only depend on the frozen config, so build them once.
+        self._title_candidates = self._candidate_title_patterns()
+        self._class_candidates = self._candidate_class_names()
+        self._title_regexes = self._compile_title_patterns(self._title_candidates)
+        ocr_fixes = {"X": "x"}
+        if self._config.normalize_letter_o:
+            ocr_fixes.update({"O": "0", "o": "0"})
+        self._ocr_translate = str.maketrans(ocr_fixes)
         self._ocr_engine = ocr_engine or self._build_ocr_engine()
         self._log_tesseract_path()
+        self._configure_opencv()
         self._running = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._ocr_thread: Optional[threading.Thread] = None
+        # Capture runs on its own thread and hands frames to the OCR worker; a
+        # frame that is still queued when a newer one arrives is dropped.
+        self._frames: _LatestFrameQueue = _LatestFrameQueue()
         self._last_address: Optional[str] = None
+        # Latest record per address for the most recent addresses, oldest first;
+        # mirrors the tail of the repository without re-reading it every frame.
+        self._recent: OrderedDict[str, AddressRecord] = OrderedDict()
         self._window: Optional[BaseWrapper] = None
         self._scan_interval = max(1.5, self._config.poll_interval_seconds)
         self._last_feedback_address: Optional[str] = None
         self._temp_file: Path = CONFIG.storage.temp_scan_file
         self._temp_file.parent.mkdir(parents=True, exist_ok=True)
+        # The scan file is rewritten every tick; keep one descriptor open instead
+        # of reopening the path, and track its size to skip no-op truncates.
+        self._temp_fd: Optional[int] = None
+        self._temp_size: Optional[int] = None
         self._clear_temp_addresses()
         self._paused = threading.Event()
+        # Set while not paused; the capture loop blocks on it instead of polling.
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        # mss keeps GDI handles that belong to the creating thread, so the grabber
+        # is opened lazily inside the capture thread.
+        self._sct: Optional[mss.base.MSSBase] = None
+        self._last_frame_hash: Optional[bytes] = None
+        # Scratch arrays for the OCR thread's resize/blur/threshold steps; the chat
+        # region rarely changes size, so they are reused instead of reallocated.
+        # Captured frames are not pooled because they cross the thread queue.
+        self._frame_buffers: dict[str, np.ndarray] = {}
+        self._last_addresses: Sequence[bytes] = ()
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -65,16 +124,29 @@ class WeChatOCRListener:
         except RuntimeError as exc:
             logger.error("%s", exc)
             raise
+        self._load_recent_history()
+        if self._paused.is_set():
+            # stop() releases a paused loop; re-arm the gate for the new threads.
+            self._resume_event.clear()
         self._running.set()
-        self._thread = threading.Thread(target=self._loop, name="WeChatOCR", daemon=True)
+        self._ocr_thread = threading.Thread(target=self._ocr_loop, name="WeChatOCR", daemon=True)
+        self._ocr_thread.start()
+        self._thread = threading.Thread(target=self._loop, name="WeChatCapture", daemon=True)
         self._thread.start()
         logger.info("WeChat OCR listener started")
 
     def stop(self) -> None:
         self._running.clear()
+        self._resume_event.set()
         if self._thread:
             self._thread.join(timeout=2)
+        if self._ocr_thread:
+            self._ocr_thread.join(timeout=2)
+        if self._thread or self._ocr_thread:
             logger.info("WeChat OCR listener stopped")
+        if not (self._ocr_thread and self._ocr_thread.is_alive()):
+            self._close_temp_file()
+            self._ocr_engine.close()
 
     def _loop(self) -> None:
         interval = self._scan_interval
@@ -82,23 +154,17 @@ class WeChatOCRListener:
             started = time.perf_counter()
             try:
                 if self._paused.is_set():
-                    time.sleep(0.2)
+                    self._resume_event.wait()
                     continue
-                frame = self._capture_frame()
-                addresses = self._process_frame(frame)
-                temp_record = self._write_temp_addresses(addresses)
-                latest = temp_record.address if temp_record else None
-                self._report_latest(latest)
-                self._log_scan_result(latest, addresses)
-                self._handle_latest_record(temp_record)
+                image = self._capture_frame()
+                self._frames.put((image, self._frame_hash(image)))
             except WindowNotFoundError as exc:
                 logger.error("Target WeChat window not found: %s", exc)
                 self._window = None
+                self._last_frame_hash = None
                 time.sleep(5.0)
-            except TesseractError as exc:
-                self._handle_ocr_failure(exc)
             except Exception as exc:
-                logger.exception("Unexpected error in OCR loop: %s", exc)
+                logger.exception("Unexpected error in capture loop: %s", exc)
                 time.sleep(2.0)
             else:
                 elapsed = time.perf_counter() - started
@@ -107,13 +173,56 @@ class WeChatOCRListener:
                     time.sleep(remaining)
                 else:
                     logger.debug(
-                        "OCR loop took %.3fs (interval %.3fs)",
+                        "Capture loop took %.3fs (interval %.3fs)",
                         elapsed,
                         interval,
                     )
+        self._close_grabber()
+
+    def _ocr_loop(self) -> None:
+        while self._running.is_set():
+            try:
+                image, frame_hash = self._frames.get(timeout=self._scan_interval)
+            except queue.Empty:
+                continue
+            if self._paused.is_set():
+                # Pausing covers in-flight frames too: nothing may be recorded or
+                # reported while a trade is running.
+                logger.debug("Dropping captured frame while paused")
+                continue
+            started = time.perf_counter()
+            try:
+                addresses = self._scan_frame(image, frame_hash)
+                temp_record = self._write_temp_addresses(addresses)
+                latest = temp_record.address if temp_record else None
+                self._report_latest(latest)
+                self._log_scan_result(latest, addresses)
+                self._handle_latest_record(temp_record)
+            except TesseractError as exc:
+                self._handle_ocr_failure(exc)
+            except Exception as exc:
+                logger.exception("Unexpected error in OCR loop: %s", exc)
+                time.sleep(2.0)
+            else:
+                elapsed = time.perf_counter() - started
+                if elapsed > self._scan_interval:
+                    logger.debug(
+                        "OCR took %.3fs (interval %.3fs)",
+                        elapsed,
+                        self._scan_interval,
+                    )
             finally:
                 self._clear_temp_addresses()
 
+    def _close_grabber(self) -> None:
+        if self._sct is None:
+            return
+        try:
+            self._sct.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to close screen grabber: %s", exc)
+        self._sct = None
+
     def _capture_frame(self) -> np.ndarray:
         window = self._locate_window()
         if self._config.force_focus:
@@ -138,36 +247,127 @@ class WeChatOCRListener:
             region[2],
             region[3],
         )
-        snapshot = window.capture_as_image()
-        if snapshot is None:
-            fallback = pyautogui.screenshot(region=region)
-            image = cv2.cvtColor(np.array(fallback), cv2.COLOR_RGB2GRAY)
-            processed = self._preprocess_frame(image)
-            self._maybe_save_debug_frame(processed)
-            return processed
-
-        left, top = rect.left, rect.top
-        width = rect.right - rect.left
-        height = rect.bottom - rect.top
-        rel_left = max(0, min(width, region[0] - left))
-        rel_top = max(0, min(height, region[1] - top))
-        rel_right = max(rel_left + 1, min(width, rel_left + region[2]))
-        rel_bottom = max(rel_top + 1, min(height, rel_top + region[3]))
-        crop_box = (rel_left, rel_top, rel_right, rel_bottom)
-        cropped = snapshot.crop(crop_box)
-        image = cv2.cvtColor(np.array(cropped), cv2.COLOR_RGB2GRAY)
-        processed = self._preprocess_frame(image)
+        return self._grab_region(region)
+
+    @staticmethod
+    def _frame_hash(image: np.ndarray) -> bytes:
+        digest = hashlib.blake2b(repr(image.shape).encode(), digest_size=8)
+        digest.update(np.ascontiguousarray(image).data)
+        return digest.digest()
+
+    def _scan_frame(self, image: np.ndarray, frame_hash: bytes) -> Sequence[bytes]:
+        # An idle chat produces identical frames; hashing the raw grayscale crop
+        # is far cheaper than preprocessing and OCR, so reuse the last result.
+        if frame_hash == self._last_frame_hash:
+            logger.debug("Chat region unchanged; reusing previous OCR result")
+            return self._last_addresses
+        processed = self._preprocess_frame(self._downsample_frame(image))
+        if self._config.batch_frames > 1 and self._ocr_engine.uses_subprocess:
+            processed, frame_hash = self._extend_batch(processed, frame_hash)
         self._maybe_save_debug_frame(processed)
-        return processed
+        addresses = self._process_frame(processed)
+        self._last_frame_hash = frame_hash
+        self._last_addresses = addresses
+        return addresses
+
+    def _extend_batch(self, first: np.ndarray, frame_hash: bytes) -> tuple[np.ndarray, bytes]:
+        # Each tesseract call pays a process spawn and model load; stacking the
+        # next changed frames under this one amortises that. Frames are stacked
+        # oldest first, so the newest address is still the last one read.
+        frames = [first.copy()]
+        deadline = time.monotonic() + self._scan_interval * (self._config.batch_frames - 1)
+        while len(frames) < self._config.batch_frames:
+            # Stop/pause must not wait out the whole batch window, which can be
+            # longer than the join timeout in stop().
+            if not self._running.is_set() or self._paused.is_set():
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                image, next_hash = self._frames.get(timeout=min(remaining, 0.2))
+            except queue.Empty:
+                continue
+            if next_hash == frame_hash:
+                continue
+            frame_hash = next_hash
+            frames.append(self._preprocess_frame(self._downsample_frame(image)).copy())
+        if len(frames) == 1:
+            return frames[0], frame_hash
+
+        width = max(frame.shape[1] for frame in frames)
+        separator = np.full((_BATCH_SEPARATOR_HEIGHT, width), 255, dtype=np.uint8)
+        parts: list[np.ndarray] = []
+        for frame in frames:
+            if parts:
+                parts.append(separator)
+            if frame.shape[1] < width:
+                frame = cv2.copyMakeBorder(
+                    frame, 0, 0, 0, width - frame.shape[1], cv2.BORDER_CONSTANT, value=255
+                )
+            parts.append(frame)
+        logger.debug("Batched %s frames into one OCR call", len(frames))
+        return np.vstack(parts), frame_hash
+
+    def _grab_region(self, region: Tuple[int, int, int, int]) -> np.ndarray:
+        if self._sct is None:
+            self._sct = mss.mss()
+        left, top, width, height = region
+        shot = self._sct.grab(
+            {"left": left, "top": top, "width": max(1, width), "height": max(1, height)}
+        )
+        # mss returns raw BGRA rows; view them in place and convert straight to gray.
+        pixels = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return cv2.cvtColor(pixels, cv2.COLOR_BGRA2GRAY)
+
+    def _downsample_frame(self, image: np.ndarray) -> np.ndarray:
+        # OCR_MAX_WIDTH and OCR_TARGET_HEIGHT form one bounding box, applied in a
+        # single resize so preprocessing and OCR both see the smaller frame.
+        height, width = image.shape[:2]
+        scale = 1.0
+        if self._config.max_ocr_width > 0:
+            scale = min(scale, self._config.max_ocr_width / width)
+        if self._config.target_height > 0:
+            scale = min(scale, self._config.target_height / height)
+        if scale >= 1.0:
+            return image
+        new_width = max(1, round(width * scale))
+        new_height = max(1, round(height * scale))
+        logger.debug("Downsampling %sx%s capture by %.3f", width, height, scale)
+        return cv2.resize(
+            image,
+            (new_width, new_height),
+            dst=self._frame_buffer("resize", (new_height, new_width)),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    def _frame_buffer(self, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+        buffer = self._frame_buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._frame_buffers[name] = buffer
+        return buffer
 
     def _preprocess_frame(self, image: np.ndarray) -> np.ndarray:
         cfg = self._config
-        processed = image
+        shape = image.shape
+        # Large frames can be offloaded to an OpenCL device through UMat; results
+        # then land in device buffers, so the host scratch arrays are not used.
+        offload = self._use_opencl and shape[0] * shape[1] >= cfg.opencl_min_pixels
+        processed = cv2.UMat(image) if offload else image
+        # MEAN_C computes its local mean with OpenCV's separable box filter, which
+        # already smooths noise, so the extra GaussianBlur pass is skipped.
+        use_mean = cfg.use_adaptive_threshold and cfg.threshold_method == "mean"
         kernel = max(1, cfg.gaussian_kernel_size)
         if kernel % 2 == 0:
             kernel += 1
-        if kernel >= 3:
-            processed = cv2.GaussianBlur(processed, (kernel, kernel), 0)
+        if kernel >= 3 and not use_mean:
+            processed = cv2.GaussianBlur(
+                processed,
+                (kernel, kernel),
+                0,
+                dst=None if offload else self._frame_buffer("blur", shape),
+            )
 
         if cfg.use_adaptive_threshold:
             block_size = cfg.threshold_block_size
@@ -177,12 +377,13 @@ class WeChatOCRListener:
             processed = cv2.adaptiveThreshold(
                 processed,
                 255,
-                cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                cv2.ADAPTIVE_THRESH_MEAN_C if use_mean else cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
                 cv2.THRESH_BINARY,
                 block_size,
                 cfg.threshold_constant,
+                dst=None if offload else self._frame_buffer("threshold", shape),
             )
-        return processed
+        return processed.get() if offload else processed
 
     def _locate_window(self) -> BaseWrapper:
         if self._window is not None:
@@ -197,7 +398,7 @@ class WeChatOCRListener:
         backend = self._config.pywinauto_backend
         errors: list[str] = []
         requested_title = self._config.window_title_pattern.strip()
-        for idx, title in enumerate(self._candidate_title_patterns()):
+        for idx, title in enumerate(self._title_candidates):
             try:
                 app = Application(backend=backend).connect(title_re=title)
                 window = app.window(title_re=title)
@@ -215,7 +416,7 @@ class WeChatOCRListener:
                 errors.append(f"title={title!r}")
 
         requested_class = self._config.window_class_name.strip()
-        for idx, class_name in enumerate(self._candidate_class_names()):
+        for idx, class_name in enumerate(self._class_candidates):
             try:
                 app = Application(backend=backend).connect(class_name=class_name)
                 window = app.window(class_name=class_name)
@@ -280,8 +481,6 @@ class WeChatOCRListener:
             logger.debug("Unable to access desktop for fallback scan: %s", exc)
             return None
 
-        title_patterns = self._candidate_title_patterns()
-        class_names = self._candidate_class_names()
         for win in desktop.windows():
             title = win.window_text()
             cls = ""
@@ -289,7 +488,7 @@ class WeChatOCRListener:
                 cls = win.friendly_class_name()
             except Exception:  # noqa: BLE001
                 cls = ""
-            if self._matches_any_pattern(title, title_patterns) or cls in class_names:
+            if self._matches_any_pattern(title, self._title_regexes) or cls in self._class_candidates:
                 try:
                     top = win.top_level_parent()
                 except Exception:  # noqa: BLE001
@@ -299,19 +498,27 @@ class WeChatOCRListener:
                 return top
         return None
 
-    def _matches_any_pattern(self, title: str, patterns: Sequence[str]) -> bool:
+    @staticmethod
+    def _compile_title_patterns(patterns: Sequence[str]) -> tuple[re.Pattern[str], ...]:
+        compiled: list[re.Pattern[str]] = []
         for pattern in patterns:
             if not pattern:
                 continue
             try:
-                if re.search(pattern, title):
-                    return True
+                compiled.append(re.compile(pattern))
             except re.error:
-                if pattern == title:
-                    return True
-        return False
+                # Not a valid regex: fall back to an exact title match.
+                compiled.append(re.compile(rf"\A{re.escape(pattern)}\Z"))
+        return tuple(compiled)
+
+    def _matches_any_pattern(self, title: str, patterns: Sequence[re.Pattern[str]]) -> bool:
+        return any(pattern.search(title) for pattern in patterns)
 
     def _focus_window(self, window: BaseWrapper, *, ensure_foreground: bool = False) -> None:
+        # set_focus is a cross-process round trip; skip it (and the restore)
+        # when WeChat already owns the foreground.
+        if self._is_foreground(window):
+            return
         try:
             window.set_focus()
         except Exception as exc:
@@ -319,9 +526,21 @@ class WeChatOCRListener:
         if ensure_foreground:
             self._ensure_foreground(window)
 
+    def _is_foreground(self, window: BaseWrapper) -> bool:
+        if win32gui is None:
+            return False
+        try:
+            root = win32gui.GetAncestor(window.handle, _GA_ROOT)
+            return bool(root) and root == win32gui.GetForegroundWindow()
+        except Exception:  # noqa: BLE001
+            return False
+
     def _ensure_foreground(self, window: BaseWrapper) -> None:
+        if self._is_foreground(window):
+            return
         try:
-            window.restore()
+            if win32gui is None or win32gui.IsIconic(window.handle):
+                window.restore()
         except Exception:
             pass
         try:
@@ -354,16 +573,15 @@ class WeChatOCRListener:
         )
         return region
 
-    def _process_frame(self, frame: np.ndarray) -> Sequence[str]:
+    def _process_frame(self, frame: np.ndarray) -> Sequence[bytes]:
         text = self._ocr_engine.run_ocr(frame)
         if logger.isEnabledFor(10):  # DEBUG
             preview = text.replace("\n", " ")[:200]
             logger.debug("OCR raw text preview: %s", preview)
-        text = unicodedata.normalize("NFKC", text)
-        if self._config.normalize_letter_o:
-            text = text.replace("O", "0").replace("o", "0")
-        text = text.replace("X", "x")
-        addresses = self._ocr_engine.extract_addresses(text)
+        text = unicodedata.normalize("NFKC", text).translate(self._ocr_translate)
+        # Candidates stay ASCII bytes from here until create_record; "?" keeps
+        # dropped non-ASCII characters from gluing fragments together.
+        addresses = self._ocr_engine.extract_addresses(text.encode("ascii", errors="replace"))
         if logger.isEnabledFor(10):
             logger.debug("Extracted addresses: %s", addresses)
         return addresses
@@ -371,9 +589,9 @@ class WeChatOCRListener:
     def _handle_latest_record(self, record: Optional[AddressRecord]) -> None:
         if not record:
             return
-        history = self._repo.read_all()
-        should_trade = self._should_execute_trade(record, history)
+        should_trade = self._should_execute_trade(record, self._recent.values())
         self._repo.append(record)
+        self._remember_recent(record)
         self._last_address = record.address
         if should_trade:
             logger.info(
@@ -395,7 +613,7 @@ class WeChatOCRListener:
     def _log_scan_result(
         self,
         latest: Optional[str],
-        addresses: Sequence[str],
+        addresses: Sequence[bytes],
     ) -> None:
         if latest:
             logger.info(
@@ -416,7 +634,7 @@ class WeChatOCRListener:
 
     def _write_temp_addresses(
         self,
-        addresses: Sequence[str],
+        addresses: Sequence[bytes],
     ) -> Optional[AddressRecord]:
         if not addresses:
             self._clear_temp_addresses()
@@ -431,53 +649,73 @@ class WeChatOCRListener:
         if not records:
             self._clear_temp_addresses()
             return None
-        data = "\n".join(record.to_line() for record in records) + "\n"
+        data = ("\n".join(record.to_line() for record in records) + "\n").encode("utf-8")
         try:
-            self._temp_file.write_text(data, encoding="utf-8")
+            fd = self._open_temp_file()
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, data)
+            os.ftruncate(fd, len(data))
+            self._temp_size = len(data)
         except Exception as exc:  # noqa: BLE001
             logger.debug("Failed to write temp address file: %s", exc)
+            self._temp_size = None
         return records[-1]
 
     def _clear_temp_addresses(self) -> None:
+        if self._temp_size == 0:
+            return
         try:
-            if self._temp_file.exists():
-                self._temp_file.write_text("", encoding="utf-8")
+            os.ftruncate(self._open_temp_file(), 0)
+            self._temp_size = 0
         except Exception as exc:  # noqa: BLE001
             logger.debug("Failed to clear temp address file: %s", exc)
 
-    def _normalize_address(self, candidate: Optional[str]) -> Optional[str]:
+    def _open_temp_file(self) -> int:
+        if self._temp_fd is None:
+            flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            self._temp_fd = os.open(self._temp_file, flags, 0o644)
+        return self._temp_fd
+
+    def _close_temp_file(self) -> None:
+        if self._temp_fd is None:
+            return
+        try:
+            os.close(self._temp_fd)
+        except OSError as exc:
+            logger.debug("Failed to close temp address file: %s", exc)
+        self._temp_fd = None
+        self._temp_size = None
+
+    def _normalize_address(self, candidate: Optional[bytes]) -> Optional[str]:
         if not candidate:
             return None
-        text = unicodedata.normalize("NFKC", candidate)
-        text = text.replace(" ", "").replace("\n", "").replace("\r", "")
-        text = text.lower()
-        if not text.startswith("0x"):
-            return None
-        if len(text) != 42:
-            return None
-        hex_part = text[2:]
-        if not all(ch in "0123456789abcdef" for ch in hex_part):
-            return None
-        return text
+        # NFKC already ran over the whole OCR text; lower-case and strip
+        # separators in one translate pass, decoding only a valid address.
+        data = candidate.translate(_UPPER_TO_LOWER, b" \n\r")
+        return data.decode("ascii") if _ADDRESS_RE.fullmatch(data) else None
+
+    def _load_recent_history(self) -> None:
+        self._recent.clear()
+        for record in self._repo.read_all()[-_RECENT_RANK:]:
+            self._remember_recent(record)
+
+    def _remember_recent(self, record: AddressRecord) -> None:
+        self._recent[record.address] = record
+        self._recent.move_to_end(record.address)
+        while len(self._recent) > _RECENT_RANK:
+            self._recent.popitem(last=False)
 
     def _should_execute_trade(
         self,
         record: AddressRecord,
-        history: Sequence[AddressRecord],
+        history: Collection[AddressRecord],
     ) -> bool:
         if not history:
             return True
-        if all(existing.address != record.address for existing in history):
-            return True
-        sorted_history = sorted(history, key=lambda r: r.timestamp, reverse=True)
-        rank: Optional[int] = None
-        for idx, existing in enumerate(sorted_history):
-            if existing.address == record.address:
-                rank = idx + 1
-                break
-        if rank is None:
-            return True
-        return rank > 3
+        # Only the most recent entries matter; nlargest keeps a small heap in one
+        # pass instead of sorting the whole history.
+        recent = heapq.nlargest(_RECENT_RANK, history, key=lambda r: r.timestamp)
+        return all(existing.address != record.address for existing in recent)
 
     def _maybe_save_debug_frame(self, frame: np.ndarray) -> None:
         if not logger.isEnabledFor(10):  # DEBUG level
@@ -491,20 +729,38 @@ class WeChatOCRListener:
 
     def _build_ocr_engine(self) -> OcrEngine:
         return OcrEngine(
-            address_pattern=self._config.address_regex,
+            address_pattern=self._config.address_pattern,
             tesseract_cmd=self._config.tesseract_cmd,
             language=self._config.tesseract_lang,
+            tesseract_config=self._config.tesseract_config,
         )
 
     def _handle_ocr_failure(self, exc: TesseractError) -> None:
         logger.error("Tesseract OCR failed: %s", exc)
+        self._last_frame_hash = None
         logger.info("Reinitializing OCR engine after failure")
         try:
+            self._ocr_engine.close()
             self._ocr_engine = self._build_ocr_engine()
         except Exception as rebuild_exc:  # noqa: BLE001
             logger.exception("Failed to rebuild OCR engine: %s", rebuild_exc)
         time.sleep(2.0)
 
+    def _configure_opencv(self) -> None:
+        requested = self._config.cv_threads
+        cv2.setUseOptimized(True)
+        self._use_opencl = self._config.use_opencl and cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            logger.info("OpenCV OpenCL preprocessing enabled")
+        elif self._config.use_opencl:
+            logger.warning("OCR_USE_OPENCL is set but no OpenCL device is available")
+        if requested < 0:
+            return
+        threads = requested or max(2, (os.cpu_count() or 2) - 1)
+        cv2.setNumThreads(threads)
+        logger.info("OpenCV preprocessing using %s thread(s)", cv2.getNumThreads())
+
     def _log_tesseract_path(self) -> None:
         path = self._config.tesseract_cmd
         if path:
@@ -518,8 +774,10 @@ class WeChatOCRListener:
         if not self._paused.is_set():
             logger.info("Pausing WeChat OCR listener")
             self._paused.set()
+            self._resume_event.clear()
 
     def resume(self) -> None:
         if self._paused.is_set():
             logger.info("Resuming WeChat OCR listener")
             self._paused.clear()
+            self._resume_event.set()